@@ -0,0 +1,26 @@
+"""Shared UTC timestamp helpers."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+
+# Set for the duration of a check cycle so every result shares one timestamp.
+_CURRENT_TS: ContextVar[Optional[str]] = ContextVar("current_ts", default=None)
+
+
+def utc_now() -> str:
+    return _CURRENT_TS.get() or datetime.now(timezone.utc).isoformat()
+
+
+@contextmanager
+def cycle_timestamp() -> Iterator[str]:
+    """Pin ``utc_now()`` to a single timestamp until the block exits."""
+    timestamp = datetime.now(timezone.utc).isoformat()
+    token = _CURRENT_TS.set(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _CURRENT_TS.reset(token)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 
@@ -16,31 +17,59 @@ def _env_int(name: str, default: int) -> int:
         return default
 
 
-class Config:
-    BASE_DIR = Path(__file__).resolve().parents[1]
-    DATA_DIR = os.getenv("NETBIRD_DATA_DIR", str(BASE_DIR / "data"))
-    LOG_DIR = os.getenv("NETBIRD_LOG_DIR", str(BASE_DIR / "logs"))
-    REPORTS_DIR = os.getenv("NETBIRD_REPORTS_DIR", str(BASE_DIR / "reports"))
-    DB_PATH = os.getenv("NETBIRD_DB_PATH", str(Path(DATA_DIR) / "sentinel.db"))
-
-    LOG_LEVEL = os.getenv("NETBIRD_LOG_LEVEL", "INFO").upper()
-    LOG_RETENTION_DAYS = _env_int("NETBIRD_LOG_RETENTION_DAYS", 7)
-
-    ROUTINE_CHECK_INTERVAL = _env_int("NETBIRD_ROUTINE_CHECK_INTERVAL", 1)
-    ROUTINE_TIMEOUT_SECONDS = _env_int("NETBIRD_ROUTINE_TIMEOUT_SECONDS", 2)
-    DEEP_TIMEOUT_SECONDS = _env_int("NETBIRD_DEEP_TIMEOUT_SECONDS", 30)
-
-    AUTO_RESTART_ENABLED = os.getenv("NETBIRD_AUTO_RESTART_ENABLED", "true").lower() == "true"
-    RESTART_WAIT_SECONDS = _env_int("NETBIRD_RESTART_WAIT_SECONDS", 10)
-    RESTART_FAILURE_THRESHOLD = _env_int("NETBIRD_RESTART_FAILURE_THRESHOLD", 10)
-    REPORT_INTERVAL_SECONDS = _env_int("NETBIRD_REPORT_INTERVAL_SECONDS", 120)
-
-    SERVICES = [
-        "gitea.netbird.cloud:3000",
-        "pve4.netbird.cloud",
-        "caddy.netbird.cloud",
-    ]
-    SERVICE_IPS = [
-        "100.71.7.102:3000",  # gitea.netbird.cloud
-        "100.71.244.136",  # caddy.netbird.cloud
-    ]
+@dataclass(frozen=True, slots=True)
+class _Config:
+    BASE_DIR: Path
+    DATA_DIR: str
+    LOG_DIR: str
+    REPORTS_DIR: str
+    DB_PATH: str
+
+    LOG_LEVEL: str
+    LOG_RETENTION_DAYS: int
+
+    ROUTINE_CHECK_INTERVAL: int
+    ROUTINE_TIMEOUT_SECONDS: int
+    DEEP_TIMEOUT_SECONDS: int
+
+    AUTO_RESTART_ENABLED: bool
+    RESTART_WAIT_SECONDS: int
+    RESTART_FAILURE_THRESHOLD: int
+    REPORT_INTERVAL_SECONDS: int
+
+    SERVICES: tuple[str, ...]
+    SERVICE_IPS: tuple[str, ...]
+
+    @classmethod
+    def from_env(cls) -> _Config:
+        base_dir = Path(__file__).resolve().parents[1]
+        data_dir = os.getenv("NETBIRD_DATA_DIR", str(base_dir / "data"))
+        return cls(
+            BASE_DIR=base_dir,
+            DATA_DIR=data_dir,
+            LOG_DIR=os.getenv("NETBIRD_LOG_DIR", str(base_dir / "logs")),
+            REPORTS_DIR=os.getenv("NETBIRD_REPORTS_DIR", str(base_dir / "reports")),
+            DB_PATH=os.getenv("NETBIRD_DB_PATH", str(Path(data_dir) / "sentinel.db")),
+            LOG_LEVEL=os.getenv("NETBIRD_LOG_LEVEL", "INFO").upper(),
+            LOG_RETENTION_DAYS=_env_int("NETBIRD_LOG_RETENTION_DAYS", 7),
+            ROUTINE_CHECK_INTERVAL=_env_int("NETBIRD_ROUTINE_CHECK_INTERVAL", 1),
+            ROUTINE_TIMEOUT_SECONDS=_env_int("NETBIRD_ROUTINE_TIMEOUT_SECONDS", 2),
+            DEEP_TIMEOUT_SECONDS=_env_int("NETBIRD_DEEP_TIMEOUT_SECONDS", 30),
+            AUTO_RESTART_ENABLED=os.getenv("NETBIRD_AUTO_RESTART_ENABLED", "true").lower() == "true",
+            RESTART_WAIT_SECONDS=_env_int("NETBIRD_RESTART_WAIT_SECONDS", 10),
+            RESTART_FAILURE_THRESHOLD=_env_int("NETBIRD_RESTART_FAILURE_THRESHOLD", 10),
+            REPORT_INTERVAL_SECONDS=_env_int("NETBIRD_REPORT_INTERVAL_SECONDS", 120),
+            SERVICES=(
+                "gitea.netbird.cloud:3000",
+                "pve4.netbird.cloud",
+                "caddy.netbird.cloud",
+            ),
+            SERVICE_IPS=(
+                "100.71.7.102:3000",  # gitea.netbird.cloud
+                "100.71.244.136",  # caddy.netbird.cloud
+            ),
+        )
+
+
+# Built once from the environment; frozen so the hot loop reads fixed slots.
+Config = _Config.from_env()
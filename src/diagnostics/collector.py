@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import contextvars
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from clock import cycle_timestamp, utc_now as _utc_now
 from monitors.deep_network import (
     get_active_connections,
     get_dns_servers,
@@ -16,20 +18,33 @@ from monitors.network_monitor import check_dns, check_internet, check_services
 from monitors.process_monitor import check_netbird_running
 from monitors.windows_events import get_recent_system_events
 
+# The routine sub-checks are independent, so they run side by side on these workers.
+_ROUTINE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="routine-check")
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+# Shared read-only default for missing sections; avoids allocating a new {} per lookup.
+_EMPTY: dict[str, Any] = {}
 
 
 def run_routine_checks() -> dict[str, Any]:
     start = time.monotonic()
-    process = check_netbird_running()
-    internet = check_internet()
-    dns = check_dns()
-    services = check_services()
+    with cycle_timestamp() as timestamp:
+        # Each task runs in its own copy of the context so it sees the cycle timestamp.
+        futures = {
+            name: _ROUTINE_POOL.submit(contextvars.copy_context().run, check)
+            for name, check in (
+                ("process", check_netbird_running),
+                ("internet", check_internet),
+                ("dns", check_dns),
+                ("services", check_services),
+            )
+        }
+        process = futures["process"].result()
+        internet = futures["internet"].result()
+        dns = futures["dns"].result()
+        services = futures["services"].result()
 
     data = {
-        "timestamp": _utc_now(),
+        "timestamp": timestamp,
         "check_type": "routine",
         "process": process,
         "internet": internet,
@@ -41,13 +56,13 @@ def run_routine_checks() -> dict[str, Any]:
 
 
 def summarize_health_check(results: dict[str, Any], status: str) -> dict[str, Any]:
-    process = results.get("process", {}).get("data", {})
-    internet = results.get("internet", {}).get("data", {})
-    dns = results.get("dns", {}).get("data", {})
-    services = results.get("services", {}).get("data", {}).get("services", {})
+    process = (results.get("process") or _EMPTY).get("data") or _EMPTY
+    internet = (results.get("internet") or _EMPTY).get("data") or _EMPTY
+    dns = (results.get("dns") or _EMPTY).get("data") or _EMPTY
+    services = ((results.get("services") or _EMPTY).get("data") or _EMPTY).get("services") or _EMPTY
 
     return {
-        "timestamp": results.get("timestamp", _utc_now()),
+        "timestamp": results.get("timestamp") or _utc_now(),
         "check_type": results.get("check_type", "routine"),
         "netbird_running": process.get("running"),
         "netbird_pid": process.get("pid"),
@@ -56,20 +71,27 @@ def summarize_health_check(results: dict[str, Any], status: str) -> dict[str, An
         "netbird_memory_mb": process.get("memory_mb"),
         "internet_reachable": internet.get("internet_reachable"),
         "dns_working": dns.get("dns_working"),
-        "services_status": services,
+        # Never hand the shared _EMPTY sentinel to callers; they may mutate the record.
+        "services_status": services if services is not _EMPTY else {},
         "system_healthy": status == "healthy",
         "check_duration_ms": results.get("check_duration_ms"),
     }
 
 
 def assess_health(results: dict[str, Any]) -> str:
-    process = results.get("process", {}).get("data", {})
-    services = results.get("services", {}).get("data", {}).get("services", {})
+    process = (results.get("process") or _EMPTY).get("data") or _EMPTY
+    services = ((results.get("services") or _EMPTY).get("data") or _EMPTY).get("services") or _EMPTY
 
     netbird_running = process.get("running") is True
-    reachable = [svc.get("reachable") for svc in services.values()]
-    any_services = any(reachable) if reachable else False
-    all_services = all(reachable) if reachable else False
+    any_services = False
+    all_services = bool(services)
+    for svc in services.values():
+        if svc.get("reachable"):
+            any_services = True
+        else:
+            all_services = False
+        if any_services and not all_services:
+            break
 
     if not netbird_running or (netbird_running and not any_services):
         return "failed"
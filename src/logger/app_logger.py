@@ -3,35 +3,115 @@
 from __future__ import annotations
 
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import os
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Any, Optional
 
 from config import Config
 from logger.formatters import build_console_formatter, build_file_formatter
+from storage.batch_writer import BatchWriter
 from storage.database import db
 
 
-class SQLiteHandler(logging.Handler):
-    """Persist log records to the meta_logs table."""
+def _record_row(record: logging.LogRecord) -> list[Any]:
+    details: Optional[dict[str, Any]] = None
+    if hasattr(record, "details") and isinstance(record.details, dict):
+        details = record.details
 
-    def emit(self, record: logging.LogRecord) -> None:
+    return db.meta_log_row(
+        level=record.levelname,
+        component=getattr(record, "component", record.name),
+        message=record.getMessage(),
+        details=details,
+        check_name=getattr(record, "check_name", None),
+        error_type=getattr(record, "error_type", None),
+        timestamp=datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+    )
+
+
+def _flush_meta_logs(records: list[logging.LogRecord]) -> None:
+    rows = []
+    for record in records:
         try:
-            details: Optional[dict[str, Any]] = None
-            if hasattr(record, "details") and isinstance(record.details, dict):
-                details = record.details
-
-            db.log_meta_log(
-                level=record.levelname,
-                component=getattr(record, "component", record.name),
-                message=record.getMessage(),
-                details=details,
-                check_name=getattr(record, "check_name", None),
-                error_type=getattr(record, "error_type", None),
-            )
+            rows.append(_record_row(record))
         except Exception:
             # Last-resort fallback: never raise from logging.
             pass
+    if rows:
+        db.log_meta_logs(rows)
+
+
+class SQLiteHandler(QueueHandler):
+    """Queue log records for batched persistence to the meta_logs table."""
+
+    def __init__(self, writer: BatchWriter) -> None:
+        super().__init__(writer.queue)
+        self.writer = writer
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.writer.put(record)
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """Size-rotated log file that buffers writes and flushes on a timer.
+
+    The stock handler stats, seeks and flushes the file for every record;
+    this one tracks the file size itself and flushes once per interval.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        *,
+        max_bytes: int,
+        backup_count: int,
+        encoding: Optional[str] = None,
+        buffer_size: int = 8192,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._buffer_size = buffer_size
+        self._size = 0
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count, encoding=encoding)
+        self._stop_flush = threading.Event()
+        self._flush_interval = flush_interval
+        threading.Thread(target=self._flush_loop, name="log-file-flush", daemon=True).start()
+
+    def _open(self):  # type: ignore[override]
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            encoding=self.encoding,
+            errors=self.errors,
+            buffering=self._buffer_size,
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        return stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.maxBytes > 0 and self._size and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        self._stop_flush.set()
+        super().close()
+
+    def _flush_loop(self) -> None:
+        # logging.shutdown() does the final flush at interpreter exit.
+        while not self._stop_flush.wait(self._flush_interval):
+            self.flush()
 
 
 def _ensure_log_dir() -> Path:
@@ -53,16 +133,18 @@ def setup_logger() -> logging.Logger:
     console_handler.setFormatter(build_console_formatter())
 
     log_dir = _ensure_log_dir()
-    file_handler = TimedRotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         log_dir / "sentinel.log",
-        when="midnight",
-        backupCount=Config.LOG_RETENTION_DAYS,
+        max_bytes=5 * 1024 * 1024,
+        backup_count=Config.LOG_RETENTION_DAYS,
         encoding="utf-8",
     )
     file_handler.setLevel(Config.LOG_LEVEL)
     file_handler.setFormatter(build_file_formatter())
 
-    sqlite_handler = SQLiteHandler()
+    sqlite_handler = SQLiteHandler(
+        BatchWriter(_flush_meta_logs, name="meta-log-writer")
+    )
     sqlite_handler.setLevel(Config.LOG_LEVEL)
 
     logger.addHandler(console_handler)
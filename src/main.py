@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import logging
 import time
-from datetime import datetime, timezone
 
+from clock import utc_now
 from config import Config
 from diagnostics.collector import (
     assess_health,
@@ -15,59 +16,74 @@ from diagnostics.collector import (
 from logger.app_logger import logger
 from reporting.report_generator import generate_report
 from recovery.netbird_restart import get_netbird_status, restart_netbird_service
+from storage.batch_writer import BatchWriter
 from storage.database import db
 
+# Shared by every plain main-loop log call instead of rebuilt per record.
+_MAIN_EXTRA = {"component": "main"}
+
+# Routine checks run every second; batch them instead of committing per row.
+health_check_writer = BatchWriter(
+    db.log_health_checks,
+    name="health-check-writer",
+    on_error=lambda message: logger.error(message, extra={"component": "storage"}),
+)
+
 
 def main() -> None:
-    logger.info("NetBird Sentinel started", extra={"component": "main"})
+    logger.info("NetBird Sentinel started", extra=_MAIN_EXTRA)
     db.initialize()
     failed_count = 0
     start_time = time.monotonic()
     report_generated = False
+    next_tick = time.monotonic()
 
     try:
         while True:
             results = run_routine_checks()
             status = assess_health(results)
             record = summarize_health_check(results, status)
-            db.log_health_check(record)
+            # Serialize here so the writer thread only binds ready-made rows.
+            health_check_writer.put(db.health_check_row(record))
 
             logger.info(
                 "Status: %s (duration_ms=%s)",
                 status,
                 results.get("check_duration_ms"),
-                extra={"component": "main"},
+                extra=_MAIN_EXTRA,
             )
 
-            services = results.get("services", {}).get("data", {}).get("services", {})
-            if services:
-                for name, info in services.items():
-                    tcp_ok = info.get("tcp_reachable") is True
-                    http_ok = info.get("http_reachable") is True
-                    tcp_tag = "OK" if tcp_ok else "FAIL"
-                    http_tag = "OK" if http_ok else "FAIL"
-                    tcp_latency = info.get("tcp_latency_ms")
-                    http_latency = info.get("latency_ms")
-                    tcp_err = info.get("tcp_error")
-                    http_err = info.get("error")
-                    logger.info(
-                        "Service %s | TCP=%s (%sms) HTTP=%s (%sms) tcp_err=%s http_err=%s",
-                        name,
-                        tcp_tag,
-                        tcp_latency if tcp_latency is not None else "-",
-                        http_tag,
-                        http_latency if http_latency is not None else "-",
-                        tcp_err or "-",
-                        http_err or "-",
-                        extra={"component": "main"},
-                    )
+            # Skip building the per-service lines entirely when INFO is filtered out.
+            if logger.isEnabledFor(logging.INFO):
+                services = results.get("services", {}).get("data", {}).get("services", {})
+                if services:
+                    for name, info in services.items():
+                        tcp_ok = info.get("tcp_reachable") is True
+                        http_ok = info.get("http_reachable") is True
+                        tcp_tag = "OK" if tcp_ok else "FAIL"
+                        http_tag = "OK" if http_ok else "FAIL"
+                        tcp_latency = info.get("tcp_latency_ms")
+                        http_latency = info.get("latency_ms")
+                        tcp_err = info.get("tcp_error")
+                        http_err = info.get("error")
+                        logger.info(
+                            "Service %s | TCP=%s (%sms) HTTP=%s (%sms) tcp_err=%s http_err=%s",
+                            name,
+                            tcp_tag,
+                            tcp_latency if tcp_latency is not None else "-",
+                            http_tag,
+                            http_latency if http_latency is not None else "-",
+                            tcp_err or "-",
+                            http_err or "-",
+                            extra=_MAIN_EXTRA,
+                        )
             if status == "failed":
                 failed_count += 1
                 logger.warning(
                     "Consecutive failed checks: %s/%s",
                     failed_count,
                     Config.RESTART_FAILURE_THRESHOLD,
-                    extra={"component": "main"},
+                    extra=_MAIN_EXTRA,
                 )
             else:
                 failed_count = 0
@@ -76,7 +92,7 @@ def main() -> None:
                 deep_results = run_deep_checks()
                 failure_id = db.log_failure(
                     {
-                        "timestamp": datetime.now(timezone.utc).isoformat(),
+                        "timestamp": utc_now(),
                         "failure_type": "auto_detected",
                         "severity": "critical",
                         "diagnostics": {"routine": results, "deep": deep_results},
@@ -85,7 +101,7 @@ def main() -> None:
                 )
 
                 if Config.AUTO_RESTART_ENABLED:
-                    logger.warning("Attempting NetBird restart", extra={"component": "main"})
+                    logger.warning("Attempting NetBird restart", extra=_MAIN_EXTRA)
                     restart_result = restart_netbird_service()
                     logger.warning(
                         "Restart result: %s",
@@ -103,13 +119,13 @@ def main() -> None:
                         failure_id,
                         {
                             "restart_successful": restart_result.get("success"),
-                            "recovery_timestamp": datetime.now(timezone.utc).isoformat(),
+                            "recovery_timestamp": utc_now(),
                             "notes": restart_result.get("stderr") or restart_result.get("stdout"),
                         },
                     )
                     time.sleep(Config.RESTART_WAIT_SECONDS)
                 else:
-                    logger.info("Auto-restart disabled", extra={"component": "main"})
+                    logger.info("Auto-restart disabled", extra=_MAIN_EXTRA)
 
                 failed_count = 0
 
@@ -118,12 +134,20 @@ def main() -> None:
                 logger.info(
                     "Report generated at %s",
                     report_path,
-                    extra={"component": "main"},
+                    extra=_MAIN_EXTRA,
                 )
                 report_generated = True
-            time.sleep(Config.ROUTINE_CHECK_INTERVAL)
+
+            # Sleep only what is left of the interval so cycles keep a steady cadence;
+            # after an overrun (e.g. a restart) start counting again from now.
+            next_tick += Config.ROUTINE_CHECK_INTERVAL
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                time.sleep(sleep_for)
+            else:
+                next_tick = time.monotonic()
     except KeyboardInterrupt:
-        logger.info("NetBird Sentinel stopped", extra={"component": "main"})
+        logger.info("NetBird Sentinel stopped", extra=_MAIN_EXTRA)
 
 
 if __name__ == "__main__":
@@ -2,24 +2,35 @@
 
 from __future__ import annotations
 
+import json
 import subprocess
-from datetime import datetime, timezone
+import sys
+import threading
 from typing import Any, Optional
 
-from config import Config
+import psutil
+
+try:
+    import pythoncom
+    import wmi
+except ImportError:  # Not on Windows or WMI bindings missing; use PowerShell instead.
+    wmi = None
 
+from clock import utc_now as _utc_now
+from config import Config
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+_CREATE_NO_WINDOW = 0x08000000 if sys.platform == "win32" else 0
 
 
 def _run(command: list[str], timeout: int) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         command,
+        stdin=subprocess.DEVNULL,
         capture_output=True,
         text=True,
         timeout=timeout,
         check=False,
+        creationflags=_CREATE_NO_WINDOW,
     )
 
 
@@ -33,14 +44,41 @@ def _result(success: bool, data: dict[str, Any], error: Optional[str], error_typ
     }
 
 
+_wmi_local = threading.local()
+
+
+def _wmi_standard_cimv2() -> Any:
+    # COM objects are apartment-bound, so keep one connection per thread.
+    conn = getattr(_wmi_local, "conn", None)
+    if conn is None:
+        pythoncom.CoInitialize()
+        conn = _wmi_local.conn = wmi.WMI(namespace="root/StandardCimv2")
+    return conn
+
+
+def _wmi_query_json(class_name: str) -> str:
+    # Raw MSFT_* CIM properties: enums stay numeric and the display properties
+    # PowerShell adds (Status, LinkSpeed, ...) are absent, unlike ConvertTo-Json.
+    instances = getattr(_wmi_standard_cimv2(), class_name)()
+    rows = [{name: getattr(item, name) for name in item.properties} for item in instances]
+    return json.dumps(rows, indent=2, default=str)
+
+
 def get_network_adapters(timeout: int = Config.DEEP_TIMEOUT_SECONDS) -> dict[str, Any]:
+    fallback: dict[str, Any] = {}
+    if wmi is not None:
+        try:
+            return _result(True, {"adapters_json": _wmi_query_json("MSFT_NetAdapter")}, None, None)
+        except Exception as exc:
+            # Keep the reason: falling back costs a PowerShell spawn on every deep check.
+            fallback["wmi_error"] = str(exc)
     result = _run(
         ["powershell", "-NoProfile", "-NonInteractive", "-Command", "Get-NetAdapter | ConvertTo-Json -Depth 3"],
         timeout,
     )
     if result.returncode == 0:
-        return _result(True, {"adapters_json": result.stdout.strip()}, None, None)
-    return _result(False, {}, result.stderr.strip(), "command_failed")
+        return _result(True, {"adapters_json": result.stdout.strip(), **fallback}, None, None)
+    return _result(False, fallback, result.stderr.strip(), "command_failed")
 
 
 def get_routing_table(timeout: int = Config.DEEP_TIMEOUT_SECONDS) -> dict[str, Any]:
@@ -51,17 +89,36 @@ def get_routing_table(timeout: int = Config.DEEP_TIMEOUT_SECONDS) -> dict[str, A
 
 
 def get_dns_servers(timeout: int = Config.DEEP_TIMEOUT_SECONDS) -> dict[str, Any]:
+    fallback: dict[str, Any] = {}
+    if wmi is not None:
+        try:
+            return _result(True, {"dns_servers_json": _wmi_query_json("MSFT_DNSClientServerAddress")}, None, None)
+        except Exception as exc:
+            fallback["wmi_error"] = str(exc)
     result = _run(
         ["powershell", "-NoProfile", "-NonInteractive", "-Command", "Get-DnsClientServerAddress | ConvertTo-Json -Depth 3"],
         timeout,
     )
     if result.returncode == 0:
-        return _result(True, {"dns_servers_json": result.stdout.strip()}, None, None)
-    return _result(False, {}, result.stderr.strip(), "command_failed")
+        return _result(True, {"dns_servers_json": result.stdout.strip(), **fallback}, None, None)
+    return _result(False, fallback, result.stderr.strip(), "command_failed")
+
+
+def _format_addr(addr: Any) -> Optional[str]:
+    return f"{addr.ip}:{addr.port}" if addr else None
 
 
 def get_active_connections(timeout: int = Config.DEEP_TIMEOUT_SECONDS) -> dict[str, Any]:
-    result = _run(["netstat", "-ano"], timeout)
-    if result.returncode == 0:
-        return _result(True, {"netstat": result.stdout.strip()}, None, None)
-    return _result(False, {}, result.stderr.strip(), "command_failed")
+    try:
+        connections = [
+            {
+                "laddr": _format_addr(conn.laddr),
+                "raddr": _format_addr(conn.raddr),
+                "status": conn.status,
+                "pid": conn.pid,
+            }
+            for conn in psutil.net_connections(kind="inet")
+        ]
+    except Exception as exc:
+        return _result(False, {}, str(exc), "exception")
+    return _result(True, {"connections": connections}, None, None)
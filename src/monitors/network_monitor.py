@@ -4,18 +4,39 @@ from __future__ import annotations
 
 import socket
 import time
-from datetime import datetime, timezone
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional, Sequence
 from urllib.parse import urlparse
 
 import requests
-from requests.exceptions import SSLError
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectTimeout, SSLError
+from urllib3.exceptions import NewConnectionError
 
+try:
+    import dns.resolver
+except ImportError:  # dnspython is optional; fall back to the OS resolver.
+    dns = None
+
+from clock import utc_now as _utc_now
 from config import Config
 
+_POOL_SIZE = 16
+
+# Shared pooled session: connections the server keeps open are reused across
+# routine checks, so steady-state probes skip the TCP/TLS handshake.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE, max_retries=0, pool_block=False)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
+# Long-lived probe workers: threads are started once, not on every routine check.
+_PROBE_POOL = ThreadPoolExecutor(max_workers=_POOL_SIZE, thread_name_prefix="service-probe")
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+# DNS answers live for minutes; re-query at most this often per domain.
+_DNS_CACHE_SECONDS = 30
+_dns_expiry: dict[str, float] = {}
 
 
 def _result(success: bool, data: dict[str, Any], error: Optional[str], error_type: Optional[str]) -> dict[str, Any]:
@@ -43,17 +64,36 @@ def check_internet(host: str = "8.8.8.8", port: int = 53, timeout: int = Config.
         )
 
 
+def _dns_resolver(timeout: int) -> dns.resolver.Resolver:
+    # Re-read the system config on every real query: NetBird rewrites the host's
+    # DNS servers when it connects or restarts. Answers are cached in check_dns.
+    resolver = dns.resolver.Resolver(configure=True)
+    resolver.timeout = timeout
+    resolver.lifetime = timeout
+    return resolver
+
+
+def _resolve(domain: str, timeout: int) -> None:
+    if dns is not None:
+        _dns_resolver(timeout).resolve(domain, "A")
+    else:
+        socket.getaddrinfo(domain, None, type=socket.SOCK_STREAM)
+
+
 def check_dns(domain: str = "google.com", timeout: int = Config.ROUTINE_TIMEOUT_SECONDS) -> dict[str, Any]:
     start = time.monotonic()
+    if _dns_expiry.get(domain, 0.0) > start:
+        return _result(True, {"dns_working": True, "latency_ms": 0, "cached": True}, None, None)
     try:
-        socket.setdefaulttimeout(timeout)
-        socket.gethostbyname(domain)
+        _resolve(domain, timeout)
+        _dns_expiry[domain] = time.monotonic() + _DNS_CACHE_SECONDS
         latency_ms = int((time.monotonic() - start) * 1000)
-        return _result(True, {"dns_working": True, "latency_ms": latency_ms}, None, None)
+        return _result(True, {"dns_working": True, "latency_ms": latency_ms, "cached": False}, None, None)
     except Exception as exc:
+        _dns_expiry.pop(domain, None)
         return _result(
             True,
-            {"dns_working": False, "latency_ms": None},
+            {"dns_working": False, "latency_ms": None, "cached": False},
             str(exc),
             "dns_failed",
         )
@@ -67,7 +107,10 @@ def _service_url(service: str) -> str:
     return f"http://{service}"
 
 
+@lru_cache(maxsize=64)
 def _parse_service(service: str) -> dict[str, Any]:
+    # Service entries come from static config, so parse each one only once.
+    # Callers must treat the returned dict as read-only.
     url = _service_url(service)
     parsed = urlparse(url)
     host = parsed.hostname or service
@@ -77,65 +120,91 @@ def _parse_service(service: str) -> dict[str, Any]:
     return {"service": service, "url": url, "host": host, "port": port}
 
 
+def _connect_failed(exc: requests.exceptions.ConnectionError) -> bool:
+    """True when the TCP connection itself could not be established."""
+    if isinstance(exc, ConnectTimeout):
+        return True
+    # requests wraps urllib3's MaxRetryError; its reason is the underlying cause.
+    # NameResolutionError subclasses NewConnectionError.
+    cause = exc.args[0] if exc.args else None
+    return isinstance(getattr(cause, "reason", cause), NewConnectionError)
+
+
+def _probe_service(service: str, timeout: int) -> tuple[str, dict[str, Any]]:
+    parsed = _parse_service(service)
+    url = parsed["url"]
+    host = parsed["host"]
+    port = parsed["port"]
+
+    # A single request covers both layers: a connect failure means TCP is down,
+    # anything after the connection was accepted means HTTP/TLS failed.
+    tcp_reachable = True
+    tcp_latency_ms = None
+    tcp_error = None
+    http_reachable = None
+    status_code = None
+    http_latency_ms = None
+    http_error = None
+
+    start = time.monotonic()
+    try:
+        response = _SESSION.get(url, timeout=(timeout, timeout))
+        tcp_latency_ms = int((time.monotonic() - start) * 1000)
+        http_latency_ms = int(response.elapsed.total_seconds() * 1000)
+        http_reachable = response.ok
+        status_code = response.status_code
+    except SSLError as exc:
+        http_reachable = False
+        http_error = f"tls_untrusted: {exc}"
+    except requests.exceptions.ConnectionError as exc:
+        http_reachable = False
+        if _connect_failed(exc):
+            tcp_reachable = False
+            tcp_error = str(exc)
+            http_error = "tcp_failed"
+        else:
+            http_error = str(exc)
+    except Exception as exc:
+        http_reachable = False
+        http_error = str(exc)
+
+    reachable = tcp_reachable if http_reachable is False and http_error and http_error.startswith("tls_untrusted") else (
+        http_reachable if http_reachable is not None else tcp_reachable
+    )
+    return service, {
+        "reachable": reachable,
+        "tcp_reachable": tcp_reachable,
+        "tcp_latency_ms": tcp_latency_ms,
+        "tcp_error": tcp_error,
+        "http_reachable": http_reachable,
+        "status_code": status_code,
+        "latency_ms": http_latency_ms,
+        "error": http_error,
+        "url": url,
+        "host": host,
+        "port": port,
+        "cached": False,
+    }
+
+
 def check_services(
-    services: Optional[list[str]] = None,
+    services: Optional[Sequence[str]] = None,
     timeout: int = Config.ROUTINE_TIMEOUT_SECONDS,
 ) -> dict[str, Any]:
     results: dict[str, Any] = {}
     combined = services or (Config.SERVICES + Config.SERVICE_IPS)
+    # Entries that point at the same URL are probed once and share the result.
+    primaries: dict[str, str] = {}
     for service in combined:
-        parsed = _parse_service(service)
-        url = parsed["url"]
-        host = parsed["host"]
-        port = parsed["port"]
-
-        tcp_start = time.monotonic()
-        tcp_reachable = False
-        tcp_latency_ms = None
-        tcp_error = None
-        try:
-            socket.create_connection((host, port), timeout=timeout).close()
-            tcp_reachable = True
-            tcp_latency_ms = int((time.monotonic() - tcp_start) * 1000)
-        except Exception as exc:
-            tcp_error = str(exc)
+        primaries.setdefault(_parse_service(service)["url"], service)
 
-        http_reachable = None
-        status_code = None
-        http_latency_ms = None
-        http_error = None
-
-        try:
-            if tcp_reachable:
-                http_start = time.monotonic()
-                response = requests.get(url, timeout=timeout)
-                http_latency_ms = int((time.monotonic() - http_start) * 1000)
-                http_reachable = response.ok
-                status_code = response.status_code
-            else:
-                http_reachable = False
-                http_error = "tcp_failed"
-        except SSLError as exc:
-            http_reachable = False
-            http_error = f"tls_untrusted: {exc}"
-        except Exception as exc:
-            http_reachable = False
-            http_error = str(exc)
+    probed: dict[str, dict[str, Any]] = {}
+    if primaries:
+        # Probes are I/O bound, so run them side by side: the check takes as long
+        # as the slowest service instead of the sum of all of them.
+        probed = dict(_PROBE_POOL.map(lambda svc: _probe_service(svc, timeout), primaries.values()))
 
-        reachable = tcp_reachable if http_reachable is False and http_error and http_error.startswith("tls_untrusted") else (
-            http_reachable if http_reachable is not None else tcp_reachable
-        )
-        results[service] = {
-            "reachable": reachable,
-            "tcp_reachable": tcp_reachable,
-            "tcp_latency_ms": tcp_latency_ms,
-            "tcp_error": tcp_error,
-            "http_reachable": http_reachable,
-            "status_code": status_code,
-            "latency_ms": http_latency_ms,
-            "error": http_error,
-            "url": url,
-            "host": host,
-            "port": port,
-        }
+    for service in combined:
+        primary = primaries[_parse_service(service)["url"]]
+        results[service] = probed[service] if service == primary else {**probed[primary], "cached": True}
     return _result(True, {"services": results}, None, None)
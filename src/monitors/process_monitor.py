@@ -3,37 +3,65 @@
 from __future__ import annotations
 
 import time
-from datetime import datetime, timezone
 from typing import Any, Optional
 
 import psutil
 
+from clock import utc_now as _utc_now
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+# Handle to the last NetBird process we found, reused until it exits.
+_cached_proc: Optional[psutil.Process] = None
+
+
+def _find_process(process_name: str) -> Optional[psutil.Process]:
+    global _cached_proc
+    needle = process_name.lower()
+    proc = _cached_proc
+    try:
+        if proc is not None and proc.is_running() and needle in proc.name().lower():
+            return proc
+    except psutil.Error:
+        pass
+
+    _cached_proc = None
+    for candidate in psutil.process_iter(["name"]):
+        name = (candidate.info.get("name") or "").lower()
+        if needle in name:
+            # Prime the CPU counter so later non-blocking reads return a real value.
+            candidate.cpu_percent(interval=None)
+            _cached_proc = candidate
+            return candidate
+    return None
 
 
 def check_netbird_running(process_name: str = "netbird") -> dict[str, Any]:
     """Return status information for the NetBird process."""
+    global _cached_proc
     start = time.monotonic()
     try:
-        for proc in psutil.process_iter(["pid", "name", "create_time", "memory_info", "cpu_percent", "num_threads"]):
-            name = (proc.info.get("name") or "").lower()
-            if process_name.lower() in name:
-                uptime_seconds = int(time.time() - float(proc.info.get("create_time") or time.time()))
-                cpu_percent = proc.cpu_percent(interval=0.1)
-                memory_info = proc.info.get("memory_info")
-                memory_mb = round(memory_info.rss / (1024 * 1024), 2) if memory_info else None
-                data = {
-                    "running": True,
-                    "pid": proc.info.get("pid"),
-                    "uptime_seconds": uptime_seconds,
-                    "cpu_percent": cpu_percent,
-                    "memory_mb": memory_mb,
-                    "threads": proc.info.get("num_threads"),
-                    "check_duration_ms": int((time.monotonic() - start) * 1000),
-                }
-                return {"success": True, "data": data, "error": None, "error_type": None, "timestamp": _utc_now()}
+        proc = _find_process(process_name)
+        if proc is not None:
+            try:
+                with proc.oneshot():
+                    uptime_seconds = int(time.time() - proc.create_time())
+                    cpu_percent = proc.cpu_percent(interval=None)
+                    memory_mb = round(proc.memory_info().rss / (1024 * 1024), 2)
+                    threads = proc.num_threads()
+            except psutil.NoSuchProcess:
+                # Exited between lookup and sampling; rescan on the next check.
+                _cached_proc = None
+                proc = None
+        if proc is not None:
+            data = {
+                "running": True,
+                "pid": proc.pid,
+                "uptime_seconds": uptime_seconds,
+                "cpu_percent": cpu_percent,
+                "memory_mb": memory_mb,
+                "threads": threads,
+                "check_duration_ms": int((time.monotonic() - start) * 1000),
+            }
+            return {"success": True, "data": data, "error": None, "error_type": None, "timestamp": _utc_now()}
 
         data = {
             "running": False,
@@ -3,24 +3,27 @@
 from __future__ import annotations
 
 import subprocess
-from datetime import datetime, timezone
+import sys
+import threading
+import xml.etree.ElementTree as ET
 from typing import Any, Optional
 
-from config import Config
+try:
+    import win32evtlog
+except ImportError:  # Not on Windows or pywin32 missing; use wevtutil instead.
+    win32evtlog = None
 
+from clock import utc_now as _utc_now
+from config import Config
 
-def _utc_now() -> str:
-    return datetime.now(timezone.utc).isoformat()
+_HAS_PYWIN32 = win32evtlog is not None
+_CREATE_NO_WINDOW = 0x08000000 if sys.platform == "win32" else 0
 
-
-def _run(command: list[str], timeout: int) -> subprocess.CompletedProcess[str]:
-    return subprocess.run(
-        command,
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-        check=False,
-    )
+_SYSTEM_EVENTS_QUERY = "*[System[(Level=1 or Level=2 or Level=3) and TimeCreated[timediff(@SystemTime) <= 300000]]]"
+_MAX_EVENTS = 50
+_EVT_BATCH_SIZE = 50
+_LEVEL_NAMES = {1: "Critical", 2: "Error", 3: "Warning"}
+_EVENT_NS = "{http://schemas.microsoft.com/win/2004/08/events/event}"
 
 
 def _result(success: bool, data: dict[str, Any], error: Optional[str], error_type: Optional[str]) -> dict[str, Any]:
@@ -33,12 +36,121 @@ def _result(success: bool, data: dict[str, Any], error: Optional[str], error_typ
     }
 
 
-def get_recent_system_events(timeout: int = Config.DEEP_TIMEOUT_SECONDS) -> dict[str, Any]:
-    query = "*[System[(Level=1 or Level=2 or Level=3) and TimeCreated[timediff(@SystemTime) <= 300000]]]"
-    result = _run(
-        ["wevtutil", "qe", "System", "/q:" + query, "/f:text", "/c:50"],
-        timeout,
+def _event_block(index: int, source: str, date: Any, event_id: Any, level: Any, description: str) -> str:
+    # Same layout as `wevtutil qe /f:text` so reports read the same on every path.
+    return "\n".join(
+        [
+            f"Event[{index}]:",
+            "  Log Name: System",
+            f"  Source: {source}",
+            f"  Date: {date}",
+            f"  Event ID: {event_id}",
+            f"  Level: {_LEVEL_NAMES.get(level, level)}",
+            "  Description:",
+            description,
+        ]
+    )
+
+
+def _format_event_message(event: Any, provider: str, publishers: dict[str, Any]) -> str:
+    try:
+        if provider not in publishers:
+            publishers[provider] = win32evtlog.EvtOpenPublisherMetadata(provider)
+        # pywin32 sizes the message buffer itself, retrying on ERROR_INSUFFICIENT_BUFFER.
+        return win32evtlog.EvtFormatMessage(publishers[provider], event, win32evtlog.EvtFormatMessageEvent)
+    except Exception:
+        return ""
+
+
+def _query_system_events(timeout: int) -> str:
+    handle = win32evtlog.EvtQuery(
+        "System",
+        win32evtlog.EvtQueryChannelPath | win32evtlog.EvtQueryReverseDirection,
+        _SYSTEM_EVENTS_QUERY,
     )
-    if result.returncode == 0:
-        return _result(True, {"system_events": result.stdout.strip()}, None, None)
-    return _result(False, {}, result.stderr.strip(), "command_failed")
+    context = win32evtlog.EvtCreateRenderContext(win32evtlog.EvtRenderContextSystem)
+    publishers: dict[str, Any] = {}
+    blocks: list[str] = []
+    while len(blocks) < _MAX_EVENTS:
+        events = win32evtlog.EvtNext(handle, _EVT_BATCH_SIZE, timeout * 1000)
+        if not events:
+            break
+        # Only the events we keep get their (expensive) message formatted.
+        for event in events[: _MAX_EVENTS - len(blocks)]:
+            values = win32evtlog.EvtRender(event, win32evtlog.EvtRenderEventValues, Context=context)
+            provider = values[win32evtlog.EvtSystemProviderName][0] or ""
+            blocks.append(
+                _event_block(
+                    len(blocks),
+                    provider,
+                    values[win32evtlog.EvtSystemTimeCreated][0],
+                    values[win32evtlog.EvtSystemEventID][0],
+                    values[win32evtlog.EvtSystemLevel][0],
+                    _format_event_message(event, provider, publishers),
+                )
+            )
+    return "\n\n".join(blocks)
+
+
+def _xml_event_block(index: int, event: ET.Element) -> str:
+    system = event.find(_EVENT_NS + "System")
+    provider = system.find(_EVENT_NS + "Provider") if system is not None else None
+    created = system.find(_EVENT_NS + "TimeCreated") if system is not None else None
+    level = system.findtext(_EVENT_NS + "Level") if system is not None else None
+    # XML output carries the raw insertion strings instead of the rendered message.
+    data = [item.text or "" for item in event.iter(_EVENT_NS + "Data")]
+    return _event_block(
+        index,
+        provider.get("Name", "") if provider is not None else "",
+        created.get("SystemTime", "") if created is not None else "",
+        system.findtext(_EVENT_NS + "EventID") if system is not None else None,
+        int(level) if level and level.isdigit() else level,
+        "; ".join(data),
+    )
+
+
+def _query_system_events_wevtutil(timeout: int) -> tuple[int, str, str]:
+    process = subprocess.Popen(
+        ["wevtutil", "qe", "System", "/q:" + _SYSTEM_EVENTS_QUERY, "/rd:true", "/f:xml", "/c:" + str(_MAX_EVENTS)],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=_CREATE_NO_WINDOW,
+    )
+    killer = threading.Timer(timeout, process.kill)
+    killer.start()
+    try:
+        # wevtutil prints bare <Event> elements; wrap them so they parse as one document.
+        parser = ET.XMLPullParser(events=("end",))
+        parser.feed(b"<Events>")
+        blocks: list[str] = []
+        for chunk in iter(lambda: process.stdout.read(65536), b""):
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                if element.tag == _EVENT_NS + "Event":
+                    blocks.append(_xml_event_block(len(blocks), element))
+                    element.clear()
+        parser.feed(b"</Events>")
+        stderr = process.stderr.read().decode(errors="replace")
+        return process.wait(), "\n\n".join(blocks), stderr
+    finally:
+        killer.cancel()
+        process.stdout.close()
+        process.stderr.close()
+
+
+def get_recent_system_events(timeout: int = Config.DEEP_TIMEOUT_SECONDS) -> dict[str, Any]:
+    fallback: dict[str, Any] = {}
+    if _HAS_PYWIN32:
+        try:
+            return _result(True, {"system_events": _query_system_events(timeout)}, None, None)
+        except Exception as exc:
+            # Keep the reason: falling back costs a wevtutil spawn on every deep check.
+            fallback["evt_error"] = str(exc)
+    try:
+        returncode, system_events, stderr = _query_system_events_wevtutil(timeout)
+    except Exception as exc:
+        return _result(False, dict(fallback), str(exc), "exception")
+    if returncode == 0:
+        return _result(True, {"system_events": system_events, **fallback}, None, None)
+    return _result(False, dict(fallback), stderr.strip(), "command_failed")
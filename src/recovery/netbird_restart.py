@@ -3,16 +3,22 @@
 from __future__ import annotations
 
 import subprocess
+import sys
 from typing import Any
 
+# Keep console-less children from allocating a window on Windows.
+_CREATE_NO_WINDOW = 0x08000000 if sys.platform == "win32" else 0
+
 
 def _run(command: list[str], timeout: int = 30) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         command,
+        stdin=subprocess.DEVNULL,
         capture_output=True,
         text=True,
         timeout=timeout,
         check=False,
+        creationflags=_CREATE_NO_WINDOW,
     )
 
 
@@ -48,22 +54,22 @@ def restart_netbird_service() -> dict[str, Any]:
             "method": "powershell_restart_service",
         }
 
-    # Fallback to net stop/start.
-    stop = _run(["net", "stop", "netbird"])
-    start = _run(["net", "start", "netbird"])
-    if stop.returncode == 0 and start.returncode == 0:
+    # Fallback to net stop/start in one shell so only a single process is spawned.
+    # "&" (not "&&") still starts the service if it was already stopped.
+    net = _run(["cmd", "/c", "net stop netbird & net start netbird"])
+    if net.returncode == 0:
         return {
             "success": True,
             "error": None,
-            "stdout": (stop.stdout + start.stdout).strip(),
-            "stderr": (stop.stderr + start.stderr).strip(),
+            "stdout": net.stdout.strip(),
+            "stderr": net.stderr.strip(),
             "method": "net_stop_start",
         }
 
     return {
         "success": False,
         "error": "restart_failed",
-        "stdout": (ps.stdout + stop.stdout + start.stdout).strip(),
-        "stderr": (ps.stderr + stop.stderr + start.stderr).strip(),
+        "stdout": (ps.stdout + net.stdout).strip(),
+        "stderr": (ps.stderr + net.stderr).strip(),
         "method": "failed",
     }
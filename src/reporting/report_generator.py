@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 import json
-from collections import Counter
+import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
+import sqlite3
 import subprocess
 import socket
+import sys
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder.
+    orjson = None
 
 from config import Config
 from diagnostics.collector import run_deep_checks
@@ -16,24 +25,45 @@ from recovery.netbird_restart import get_netbird_status
 from storage.database import db
 
 
+_CREATE_NO_WINDOW = 0x08000000 if sys.platform == "win32" else 0
+
+_HAS_ALPHA = re.compile(r"[A-Za-z]").search
+_QUANTUM_RE = re.compile(r"^(quantum resistance|peers count):(.*)$", re.I | re.M)
+_loads = orjson.loads if orjson is not None else json.loads
+
+# `netbird status` is read at most once per report; generate_report clears this.
+_cached_status = lru_cache(maxsize=1)(get_netbird_status)
+
+
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _g(row: sqlite3.Row, key: str, default: Any = None) -> Any:
+    """``dict.get`` for ``sqlite3.Row`` so rows need not be copied into dicts."""
+    try:
+        value = row[key]
+    except IndexError:
+        return default
+    return default if value is None else value
+
+
 def _load_services_status(raw: Any) -> dict[str, Any]:
     if raw is None:
         return {}
     if isinstance(raw, dict):
         return raw
     try:
-        return json.loads(raw)
+        decoded = _loads(raw)
     except Exception:
         return {}
+    return decoded if isinstance(decoded, dict) else {}
 
 
-def _detect_issues(checks: list[dict[str, Any]]) -> list[str]:
+def _analyze_checks(checks: Sequence[sqlite3.Row]) -> tuple[list[str], dict[str, dict[str, int]], list[str]]:
+    """Return (issues, per-service counts, stack summary) from one pass over ``checks``."""
     if not checks:
-        return ["No health checks found yet."]
+        return ["No health checks found yet."], {}, ["No health checks available for stack analysis."]
 
     internet_fail = 0
     dns_fail = 0
@@ -41,35 +71,85 @@ def _detect_issues(checks: list[dict[str, Any]]) -> list[str]:
     all_services_down = 0
     hostname_up_ip_down = 0
     hostname_down_ip_up = 0
+    tcp_fail_total = 0
+    http_fail_total = 0
+    service_points = 0
+    counts: dict[str, dict[str, int]] = {}
+    # Service keys repeat across rows, so classify each one only once.
+    is_hostname: dict[str, bool] = {}
 
     for check in checks:
-        if check.get("internet_reachable") is False:
+        if _g(check, "internet_reachable") is False:
             internet_fail += 1
-        if check.get("dns_working") is False:
+        if _g(check, "dns_working") is False:
             dns_fail += 1
-        if check.get("netbird_running") is False:
+        if _g(check, "netbird_running") is False:
             process_down += 1
 
-        services = _load_services_status(check.get("services_status"))
-        if services:
-            reachables = [v.get("reachable") for v in services.values() if isinstance(v, dict)]
-            if reachables and not any(reachables):
-                all_services_down += 1
-
-            hostname_reach = []
-            ip_reach = []
-            for key, value in services.items():
-                if not isinstance(value, dict):
-                    continue
-                if any(ch.isalpha() for ch in key):
-                    hostname_reach.append(value.get("reachable"))
-                else:
-                    ip_reach.append(value.get("reachable"))
-            if hostname_reach and ip_reach:
-                if any(hostname_reach) and not any(ip_reach):
-                    hostname_up_ip_down += 1
-                if not any(hostname_reach) and any(ip_reach):
-                    hostname_down_ip_up += 1
+        services = _load_services_status(_g(check, "services_status"))
+        if not services:
+            continue
+
+        any_reachable = False
+        hostname_seen = hostname_up = ip_seen = ip_up = False
+        for name, info in services.items():
+            if not isinstance(info, dict):
+                continue
+            service_points += 1
+            reachable = info.get("reachable")
+            if reachable:
+                any_reachable = True
+
+            hostname = is_hostname.get(name)
+            if hostname is None:
+                hostname = is_hostname[name] = _HAS_ALPHA(name) is not None
+            if hostname:
+                hostname_seen = True
+                hostname_up = hostname_up or bool(reachable)
+            else:
+                ip_seen = True
+                ip_up = ip_up or bool(reachable)
+
+            c = counts.get(name)
+            if c is None:
+                c = counts[name] = {
+                    "reachable": 0,
+                    "unreachable": 0,
+                    "tcp_samples": 0,
+                    "tcp_ok": 0,
+                    "tcp_fail": 0,
+                    "http_samples": 0,
+                    "http_ok": 0,
+                    "http_fail": 0,
+                }
+            if reachable:
+                c["reachable"] += 1
+            else:
+                c["unreachable"] += 1
+            tcp = info.get("tcp_reachable")
+            if "tcp_reachable" in info:
+                c["tcp_samples"] += 1
+            if tcp is True:
+                c["tcp_ok"] += 1
+            elif tcp is False:
+                c["tcp_fail"] += 1
+                tcp_fail_total += 1
+            http = info.get("http_reachable")
+            if "http_reachable" in info:
+                c["http_samples"] += 1
+            if http is True:
+                c["http_ok"] += 1
+            elif http is False:
+                c["http_fail"] += 1
+                http_fail_total += 1
+
+        if (hostname_seen or ip_seen) and not any_reachable:
+            all_services_down += 1
+        if hostname_seen and ip_seen:
+            if hostname_up and not ip_up:
+                hostname_up_ip_down += 1
+            if not hostname_up and ip_up:
+                hostname_down_ip_up += 1
 
     issues: list[str] = []
     total = len(checks)
@@ -85,72 +165,26 @@ def _detect_issues(checks: list[dict[str, Any]]) -> list[str]:
         issues.append("Hostname services down while IP services up: likely DNS or hostname routing issue.")
     if hostname_up_ip_down:
         issues.append("Hostname services up while IP services down: possible DNS override or IP routing issue.")
-
     if not issues:
         issues.append("No obvious failures detected in recent checks.")
-    return issues
-
-
-def _summarize_services(checks: list[dict[str, Any]]) -> dict[str, Any]:
-    counts: dict[str, Counter] = {}
-    for check in checks:
-        services = _load_services_status(check.get("services_status"))
-        for name, info in services.items():
-            if not isinstance(info, dict):
-                continue
-            counts.setdefault(name, Counter())
-            counts[name]["reachable"] += 1 if info.get("reachable") else 0
-            counts[name]["unreachable"] += 0 if info.get("reachable") else 1
-            if "tcp_reachable" in info:
-                counts[name]["tcp_samples"] += 1
-            if info.get("tcp_reachable") is True:
-                counts[name]["tcp_ok"] += 1
-            if info.get("tcp_reachable") is False:
-                counts[name]["tcp_fail"] += 1
-            if "http_reachable" in info:
-                counts[name]["http_samples"] += 1
-            if info.get("http_reachable") is True:
-                counts[name]["http_ok"] += 1
-            if info.get("http_reachable") is False:
-                counts[name]["http_fail"] += 1
-    return {k: dict(v) for k, v in counts.items()}
 
-
-def _summarize_stack(checks: list[dict[str, Any]]) -> list[str]:
-    if not checks:
-        return ["No health checks available for stack analysis."]
-
-    tcp_fail_total = 0
-    http_fail_total = 0
-    service_points = 0
-
-    for check in checks:
-        services = _load_services_status(check.get("services_status"))
-        for info in services.values():
-            if not isinstance(info, dict):
-                continue
-            service_points += 1
-            if info.get("tcp_reachable") is False:
-                tcp_fail_total += 1
-            if info.get("http_reachable") is False:
-                http_fail_total += 1
-
-    lines = []
+    stack_summary = []
     if service_points:
-        lines.append(f"Service probes: {service_points}")
-        lines.append(f"TCP failures: {tcp_fail_total}/{service_points}")
-        lines.append(f"HTTP failures: {http_fail_total}/{service_points}")
-    return lines
+        stack_summary.append(f"Service probes: {service_points}")
+        stack_summary.append(f"TCP failures: {tcp_fail_total}/{service_points}")
+        stack_summary.append(f"HTTP failures: {http_fail_total}/{service_points}")
+    return issues, counts, stack_summary
 
 
 def _parse_quantum_status(status_text: str) -> dict[str, Any]:
     quantum = None
     peers = None
-    for line in status_text.splitlines():
-        if line.lower().startswith("quantum resistance:"):
-            quantum = line.split(":", 1)[1].strip().lower() == "true"
-        if line.lower().startswith("peers count:"):
-            peers = line.split(":", 1)[1].strip()
+    for match in _QUANTUM_RE.finditer(status_text):
+        value = match.group(2).strip()
+        if match.group(1).lower() == "quantum resistance":
+            quantum = value.lower() == "true"
+        else:
+            peers = value
     return {"quantum_resistance": quantum, "peers_count": peers}
 
 
@@ -158,10 +192,12 @@ def _run_cmd(command: list[str], timeout: int = 10) -> dict[str, Any]:
     try:
         result = subprocess.run(
             command,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
             text=True,
             timeout=timeout,
             check=False,
+            creationflags=_CREATE_NO_WINDOW,
         )
         return {
             "success": result.returncode == 0,
@@ -173,129 +209,155 @@ def _run_cmd(command: list[str], timeout: int = 10) -> dict[str, Any]:
         return {"success": False, "stdout": "", "stderr": str(exc), "returncode": None}
 
 
-def _resolve_services(services: list[str]) -> dict[str, Any]:
-    results: dict[str, Any] = {}
-    for entry in services:
-        host = entry.split(":")[0]
-        try:
-            ip = socket.gethostbyname(host)
-            results[host] = {"resolved": True, "ip": ip}
-        except Exception as exc:
-            results[host] = {"resolved": False, "error": str(exc)}
-    return results
+def _resolve_host(host: str) -> dict[str, Any]:
+    try:
+        infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        return {"resolved": True, "ip": addresses[0], "addresses": addresses}
+    except Exception as exc:
+        return {"resolved": False, "error": str(exc)}
+
+
+def _resolve_services(services: Sequence[str]) -> dict[str, Any]:
+    hosts = list(dict.fromkeys(entry.split(":")[0] for entry in services))
+    if not hosts:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(32, len(hosts))) as executor:
+        return dict(zip(hosts, executor.map(_resolve_host, hosts)))
 
 
 def generate_report() -> Path:
-    db.initialize()
-    checks = [dict(r) for r in db.get_recent_health_checks()]
-    failures = [dict(r) for r in db.get_recent_failures()]
+    # The CLI calls and DNS lookups are independent; start them now and collect
+    # each result only where the report needs it.
+    _cached_status.cache_clear()
+    executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="report")
+    status_future = executor.submit(_cached_status)
+    status_json_future = executor.submit(_run_cmd, ["netbird", "status", "--json"])
+    routes_list_future = executor.submit(_run_cmd, ["netbird", "routes", "list"])
+    dns_map_future = executor.submit(_resolve_services, Config.SERVICES)
 
-    issues = _detect_issues(checks)
-    services_summary = _summarize_services(checks)
-    stack_summary = _summarize_stack(checks)
+    db.initialize()
+    checks = db.get_recent_health_check_summaries()
+    failures = db.get_recent_failures()
 
     deep: dict[str, Any] = {}
     if failures:
         latest = failures[0]
         try:
-            diagnostics = json.loads(latest.get("diagnostics") or "{}")
+            diagnostics = _loads(_g(latest, "diagnostics") or "{}")
             deep = diagnostics.get("deep", {}) if isinstance(diagnostics, dict) else {}
         except Exception:
             deep = {}
-    if not deep:
-        deep = run_deep_checks()
-
-    report_lines = []
-    report_lines.append("NetBird Sentinel Report")
-    report_lines.append(f"Generated: {_utc_now()}")
-    report_lines.append("")
-    report_lines.append(f"Health checks captured: {len(checks)}")
-    report_lines.append(f"Failures captured: {len(failures)}")
-    report_lines.append("")
-    report_lines.append("Likely Issues")
-    for item in issues:
-        report_lines.append(f"- {item}")
-    report_lines.append("")
-
-    status = get_netbird_status()
-    quantum_info = _parse_quantum_status(status.get("stdout", ""))
-    if quantum_info.get("quantum_resistance") is True and "All monitored services unreachable" in " ".join(issues):
-        report_lines.append("Likely Root Cause")
-        report_lines.append(
-            "- Quantum resistance is enabled; peers that do not support it may fail to connect to the data plane."
-        )
-        if quantum_info.get("peers_count"):
-            report_lines.append(f"- Peers count: {quantum_info.get('peers_count')}")
-        report_lines.append("")
-    report_lines.append("Service Reachability Summary")
-    for name, summary in services_summary.items():
-        report_lines.append(f"- {name}: {summary}")
-    report_lines.append("")
-    report_lines.append("Network Stack Summary")
-    for line in stack_summary:
-        report_lines.append(f"- {line}")
-    report_lines.append("")
-    report_lines.append("Raw Attachments")
+    # Only collect fresh deep diagnostics when no stored failure has them; they
+    # run alongside the CLI calls while the checks are summarized.
+    deep_future = executor.submit(run_deep_checks) if not deep else None
+    executor.shutdown(wait=False)
+
+    issues, services_summary, stack_summary = _analyze_checks(checks)
+    # These two can raise; settle them before the report file exists so a
+    # failure does not leave a truncated report behind.
+    status = status_future.result()
+    if deep_future is not None:
+        deep = deep_future.result()
 
     report_dir = Path(Config.REPORTS_DIR)
     report_dir.mkdir(parents=True, exist_ok=True)
     filename = f"report-{datetime.now(timezone.utc).strftime('%Y%m%d-%H%M%S')}.txt"
     path = report_dir / filename
 
-    def write_raw(suffix: str, content: str) -> Path:
-        attachment = report_dir / f"{path.stem}-{suffix}"
-        attachment.write_text(content or "EMPTY", encoding="utf-8")
-        report_lines.append(f"- {attachment.name}")
-        return attachment
-
-    if deep:
-        adapters = deep.get("network_adapters", {}).get("data", {}).get("adapters_json", "")
-        dns_servers = deep.get("dns_servers", {}).get("data", {}).get("dns_servers_json", "")
-        routing_table = deep.get("routing_table", {}).get("data", {}).get("routing_table", "")
-        netstat = deep.get("active_connections", {}).get("data", {}).get("netstat", "")
-        system_events = deep.get("windows_events", {}).get("data", {}).get("system_events", "")
-
-        write_raw("adapters.json", adapters)
-        write_raw("dns_servers.json", dns_servers)
-        write_raw("routing_table.txt", routing_table)
-        write_raw("netstat.txt", netstat)
-        write_raw("windows_events.txt", system_events)
-    else:
-        report_lines.append("- No deep diagnostics available.")
-
-    write_raw(
-        "netbird_status.txt",
-        status.get("stdout", "") + ("\n" + status.get("stderr", "") if status.get("stderr") else ""),
-    )
-
-    status_json = _run_cmd(["netbird", "status", "--json"])
-    write_raw(
-        "netbird_status.json",
-        status_json.get("stdout", "") + ("\n" + status_json.get("stderr", "") if status_json.get("stderr") else ""),
-    )
-
-    routes_list = _run_cmd(["netbird", "routes", "list"])
-    write_raw(
-        "netbird_routes_list.txt",
-        routes_list.get("stdout", "") + ("\n" + routes_list.get("stderr", "") if routes_list.get("stderr") else ""),
-    )
-
-    dns_map = _resolve_services(Config.SERVICES)
-    write_raw("dns_resolution.json", json.dumps(dns_map, indent=2))
-
-    report_lines.append("")
+    # Stream the report straight to disk instead of joining it in memory first.
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as fh:
+
+        def emit(line: str = "") -> None:
+            fh.write(line)
+            fh.write("\n")
+
+        def write_raw(suffix: str, content: str) -> Path:
+            attachment = report_dir / f"{path.stem}-{suffix}"
+            attachment.write_text(content or "EMPTY", encoding="utf-8")
+            emit(f"- {attachment.name}")
+            return attachment
+
+        emit("NetBird Sentinel Report")
+        emit(f"Generated: {_utc_now()}")
+        emit()
+        emit(f"Health checks captured: {len(checks)}")
+        emit(f"Failures captured: {len(failures)}")
+        emit()
+        emit("Likely Issues")
+        for item in issues:
+            emit(f"- {item}")
+        emit()
+
+        quantum_info = _parse_quantum_status(status.get("stdout", ""))
+        if quantum_info.get("quantum_resistance") is True and "All monitored services unreachable" in " ".join(issues):
+            emit("Likely Root Cause")
+            emit("- Quantum resistance is enabled; peers that do not support it may fail to connect to the data plane.")
+            if quantum_info.get("peers_count"):
+                emit(f"- Peers count: {quantum_info.get('peers_count')}")
+            emit()
+        emit("Service Reachability Summary")
+        for name, summary in services_summary.items():
+            emit(f"- {name}: {summary}")
+        emit()
+        emit("Network Stack Summary")
+        for line in stack_summary:
+            emit(f"- {line}")
+        emit()
+        emit("Raw Attachments")
+
+        if deep:
+            adapters = deep.get("network_adapters", {}).get("data", {}).get("adapters_json", "")
+            dns_servers = deep.get("dns_servers", {}).get("data", {}).get("dns_servers_json", "")
+            routing_table = deep.get("routing_table", {}).get("data", {}).get("routing_table", "")
+            active_connections = deep.get("active_connections", {}).get("data", {})
+            connections = active_connections.get("connections")
+            system_events = deep.get("windows_events", {}).get("data", {}).get("system_events", "")
+
+            write_raw("adapters.json", adapters)
+            write_raw("dns_servers.json", dns_servers)
+            write_raw("routing_table.txt", routing_table)
+            if connections is not None:
+                write_raw("connections.json", json.dumps(connections, indent=2))
+            else:
+                # Failures recorded before connections were collected via psutil.
+                write_raw("netstat.txt", active_connections.get("netstat", ""))
+            write_raw("windows_events.txt", system_events)
+        else:
+            emit("- No deep diagnostics available.")
+
+        write_raw(
+            "netbird_status.txt",
+            status.get("stdout", "") + ("\n" + status.get("stderr", "") if status.get("stderr") else ""),
+        )
+
+        status_json = status_json_future.result()
+        write_raw(
+            "netbird_status.json",
+            status_json.get("stdout", "") + ("\n" + status_json.get("stderr", "") if status_json.get("stderr") else ""),
+        )
+
+        routes_list = routes_list_future.result()
+        write_raw(
+            "netbird_routes_list.txt",
+            routes_list.get("stdout", "") + ("\n" + routes_list.get("stderr", "") if routes_list.get("stderr") else ""),
+        )
+
+        dns_map = dns_map_future.result()
+        write_raw("dns_resolution.json", json.dumps(dns_map, indent=2))
+
+        emit()
+
+        if failures:
+            latest = failures[0]
+            emit("Latest Failure Snapshot")
+            emit(f"- timestamp: {_g(latest, 'timestamp')}")
+            emit(f"- failure_type: {_g(latest, 'failure_type')}")
+            emit(f"- severity: {_g(latest, 'severity')}")
+            emit(f"- restart_successful: {_g(latest, 'restart_successful')}")
+            notes = _g(latest, "notes")
+            if notes:
+                emit("- notes:")
+                emit(notes)
 
-    if failures:
-        latest = failures[0]
-        report_lines.append("Latest Failure Snapshot")
-        report_lines.append(f"- timestamp: {latest.get('timestamp')}")
-        report_lines.append(f"- failure_type: {latest.get('failure_type')}")
-        report_lines.append(f"- severity: {latest.get('severity')}")
-        report_lines.append(f"- restart_successful: {latest.get('restart_successful')}")
-        notes = latest.get("notes")
-        if notes:
-            report_lines.append("- notes:")
-            report_lines.append(notes)
-
-    path.write_text("\n".join(report_lines), encoding="utf-8")
     return path
@@ -0,0 +1,111 @@
+"""Background batching for high-frequency SQLite inserts."""
+
+from __future__ import annotations
+
+import atexit
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class BatchWriter:
+    """Drain queued items on a background thread and flush them in batches.
+
+    Items are handed to ``flush`` roughly every ``interval`` seconds, or sooner
+    once ``max_items`` are pending, so each batch costs a single commit.
+    Dropped items and failed batches are counted and passed to ``on_error``
+    (stderr by default, so the meta-log writer never reports into itself).
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[Any]], None],
+        *,
+        interval: float = 1.0,
+        max_items: int = 500,
+        maxsize: int = 10000,
+        name: str = "batch-writer",
+        on_error: Optional[Callable[[str], None]] = None,
+    ) -> None:
+        self.queue: queue.Queue[Any] = queue.Queue(maxsize=maxsize)
+        self._flush = flush
+        self._interval = interval
+        self._max_items = max_items
+        self._name = name
+        self._on_error = on_error
+        self.dropped = 0
+        self.failed = 0
+        self._unreported_drops = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+            self._thread.start()
+            atexit.register(self.stop)
+
+    def put(self, item: Any) -> None:
+        self.start()
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            # Dropping beats blocking the monitor loop on a stalled disk; the
+            # writer thread reports the drops once per interval.
+            with self._counter_lock:
+                self.dropped += 1
+                self._unreported_drops += 1
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._interval * 5)
+
+    def _report(self, message: str) -> None:
+        message = f"{self._name}: {message}"
+        if self._on_error is not None:
+            try:
+                self._on_error(message)
+                return
+            except Exception:
+                pass
+        print(message, file=sys.stderr)
+
+    def _drain(self, deadline: float) -> list[Any]:
+        batch: list[Any] = []
+        while len(batch) < self._max_items:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0 and not self._stop.is_set():
+                    batch.append(self.queue.get(timeout=remaining))
+                else:
+                    batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._drain(time.monotonic() + self._interval)
+            if batch:
+                try:
+                    self._flush(batch)
+                except Exception as exc:
+                    # Never let a bad batch kill the writer thread.
+                    self.failed += len(batch)
+                    self._report(f"failed to write batch of {len(batch)} items ({self.failed} total): {exc!r}")
+            with self._counter_lock:
+                drops, self._unreported_drops = self._unreported_drops, 0
+                dropped = self.dropped
+            if drops:
+                self._report(f"queue full, dropped {drops} items ({dropped} total)")
+            if self._stop.is_set() and self.queue.empty():
+                return
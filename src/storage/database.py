@@ -4,32 +4,94 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from threading import Lock
-from typing import Any, Iterable, Optional
+from threading import RLock, local
+from typing import Any, Iterable, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the stdlib encoder works the same way.
+    orjson = None
 
 from config import Config
 from storage.models import schema_statements
 
 
+HEALTH_CHECK_INSERT = """
+INSERT INTO health_checks (
+    timestamp, check_type,
+    netbird_running, netbird_pid, netbird_uptime_seconds,
+    netbird_cpu_percent, netbird_memory_mb,
+    internet_reachable, dns_working, services_status,
+    system_healthy, check_duration_ms
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+META_LOG_INSERT = """
+INSERT INTO meta_logs (
+    timestamp, level, component, message,
+    details, check_name, error_type
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+WINDOWS_EVENT_INSERT = """
+INSERT INTO windows_events (
+    captured_timestamp, event_timestamp, event_id,
+    source, level, message, related_failure_id
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# WAL lets the report generator read while the writers commit, and NORMAL
+# sync drops one fsync per transaction (safe under WAL).
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
 def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+if orjson is not None:
+
+    def _dumps(value: Any) -> str:
+        # Decode so the TEXT columns keep holding text rather than BLOBs.
+        return orjson.dumps(value).decode()
+
+else:
+
+    def _dumps(value: Any) -> str:
+        # Compact separators: diagnostics blobs are large and only read back by code.
+        return json.dumps(value, separators=(",", ":"))
+
+
 @dataclass
 class Database:
     path: str
-    _conn: Optional[sqlite3.Connection] = None
-    _lock: Lock = Lock()
+    # One connection per thread: under WAL, readers then never wait on writers.
+    _tls: local = field(default_factory=local)
+    _lock: RLock = field(default_factory=RLock)
 
     def connect(self) -> sqlite3.Connection:
-        if self._conn is None:
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
             Path(self.path).parent.mkdir(parents=True, exist_ok=True)
-            self._conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
-            self._conn.row_factory = sqlite3.Row
-        return self._conn
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._tls.conn = conn
+            self._tls.batch_depth = 0
+            self._tls.batch_cursor = None
+        return conn
 
     def initialize(self) -> None:
         conn = self.connect()
@@ -38,43 +100,80 @@ class Database:
                 conn.execute(stmt)
             conn.commit()
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer commits for writes made inside the block to a single one on exit."""
+        conn = self.connect()
+        tls = self._tls
+        with self._lock:
+            tls.batch_depth += 1
+            try:
+                yield
+            except BaseException:
+                if tls.batch_depth == 1:
+                    conn.rollback()
+                raise
+            else:
+                if tls.batch_depth == 1:
+                    conn.commit()
+            finally:
+                tls.batch_depth -= 1
+
+    def _query(self, query: str, params: Iterable[Any] | None = None) -> list[sqlite3.Row]:
+        # Reads use this thread's connection and skip the write lock entirely.
+        return self.connect().execute(query, params or []).fetchall()
+
     def _execute(
-        self, query: str, params: Iterable[Any] | None = None
+        self, query: str, params: Iterable[Any] | None = None, *, commit: bool = True
     ) -> sqlite3.Cursor:
         conn = self.connect()
         with self._lock:
             cursor = conn.execute(query, params or [])
-            conn.commit()
+            if commit and not self._tls.batch_depth:
+                conn.commit()
         return cursor
 
+    def _executemany(self, query: str, rows: Iterable[Iterable[Any]], *, commit: bool = True) -> None:
+        conn = self.connect()
+        tls = self._tls
+        with self._lock:
+            # Batch inserts run on the writer threads; each reuses its own cursor.
+            if tls.batch_cursor is None:
+                tls.batch_cursor = conn.cursor()
+            try:
+                tls.batch_cursor.executemany(query, rows)
+            except Exception:
+                if not tls.batch_depth:
+                    conn.rollback()
+                raise
+            if commit and not tls.batch_depth:
+                conn.commit()
+
+    @staticmethod
+    def health_check_row(data: dict[str, Any]) -> list[Any]:
+        return [
+            data.get("timestamp") or _utc_now(),
+            data.get("check_type", "routine"),
+            data.get("netbird_running"),
+            data.get("netbird_pid"),
+            data.get("netbird_uptime_seconds"),
+            data.get("netbird_cpu_percent"),
+            data.get("netbird_memory_mb"),
+            data.get("internet_reachable"),
+            data.get("dns_working"),
+            _dumps(data.get("services_status", {})),
+            data.get("system_healthy"),
+            data.get("check_duration_ms"),
+        ]
+
     def log_health_check(self, data: dict[str, Any]) -> int:
-        cursor = self._execute(
-            """
-            INSERT INTO health_checks (
-                timestamp, check_type,
-                netbird_running, netbird_pid, netbird_uptime_seconds,
-                netbird_cpu_percent, netbird_memory_mb,
-                internet_reachable, dns_working, services_status,
-                system_healthy, check_duration_ms
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                data.get("timestamp", _utc_now()),
-                data.get("check_type", "routine"),
-                data.get("netbird_running"),
-                data.get("netbird_pid"),
-                data.get("netbird_uptime_seconds"),
-                data.get("netbird_cpu_percent"),
-                data.get("netbird_memory_mb"),
-                data.get("internet_reachable"),
-                data.get("dns_working"),
-                json.dumps(data.get("services_status", {})),
-                data.get("system_healthy"),
-                data.get("check_duration_ms"),
-            ],
-        )
+        cursor = self._execute(HEALTH_CHECK_INSERT, self.health_check_row(data))
         return int(cursor.lastrowid)
 
+    def log_health_checks(self, rows: list[list[Any]]) -> None:
+        """Insert rows built by ``health_check_row`` in a single transaction."""
+        self._executemany(HEALTH_CHECK_INSERT, rows)
+
     def log_failure(self, data: dict[str, Any]) -> int:
         cursor = self._execute(
             """
@@ -85,10 +184,10 @@ class Database:
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
             """,
             [
-                data.get("timestamp", _utc_now()),
+                data.get("timestamp") or _utc_now(),
                 data.get("failure_type", "auto_detected"),
                 data.get("severity"),
-                json.dumps(data.get("diagnostics", {})),
+                _dumps(data.get("diagnostics", {})),
                 data.get("auto_restart_attempted"),
                 data.get("restart_successful"),
                 data.get("recovery_timestamp"),
@@ -113,26 +212,47 @@ class Database:
             values,
         )
 
+    @staticmethod
+    def windows_event_row(data: dict[str, Any]) -> list[Any]:
+        return [
+            data.get("captured_timestamp") or _utc_now(),
+            data.get("event_timestamp") or _utc_now(),
+            data.get("event_id"),
+            data.get("source"),
+            data.get("level"),
+            data.get("message"),
+            data.get("related_failure_id"),
+        ]
+
     def log_windows_event(self, data: dict[str, Any]) -> int:
-        cursor = self._execute(
-            """
-            INSERT INTO windows_events (
-                captured_timestamp, event_timestamp, event_id,
-                source, level, message, related_failure_id
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                data.get("captured_timestamp", _utc_now()),
-                data.get("event_timestamp", _utc_now()),
-                data.get("event_id"),
-                data.get("source"),
-                data.get("level"),
-                data.get("message"),
-                data.get("related_failure_id"),
-            ],
-        )
+        cursor = self._execute(WINDOWS_EVENT_INSERT, self.windows_event_row(data))
         return int(cursor.lastrowid)
 
+    def log_windows_events_many(self, events: Iterable[dict[str, Any]]) -> None:
+        """Insert several Windows events in a single transaction."""
+        self._executemany(WINDOWS_EVENT_INSERT, [self.windows_event_row(e) for e in events])
+
+    @staticmethod
+    def meta_log_row(
+        *,
+        level: str,
+        component: str,
+        message: str,
+        details: Optional[dict[str, Any]] = None,
+        check_name: Optional[str] = None,
+        error_type: Optional[str] = None,
+        timestamp: Optional[str] = None,
+    ) -> list[Any]:
+        return [
+            timestamp or _utc_now(),
+            level,
+            component,
+            message,
+            _dumps(details) if details else None,
+            check_name,
+            error_type,
+        ]
+
     def log_meta_log(
         self,
         *,
@@ -144,37 +264,43 @@ class Database:
         error_type: Optional[str] = None,
     ) -> int:
         cursor = self._execute(
-            """
-            INSERT INTO meta_logs (
-                timestamp, level, component, message,
-                details, check_name, error_type
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-            [
-                _utc_now(),
-                level,
-                component,
-                message,
-                json.dumps(details) if details else None,
-                check_name,
-                error_type,
-            ],
+            META_LOG_INSERT,
+            self.meta_log_row(
+                level=level,
+                component=component,
+                message=message,
+                details=details,
+                check_name=check_name,
+                error_type=error_type,
+            ),
         )
         return int(cursor.lastrowid)
 
+    def log_meta_logs(self, rows: list[list[Any]]) -> None:
+        """Insert rows built by ``meta_log_row`` in a single transaction."""
+        self._executemany(META_LOG_INSERT, rows)
+
     def get_recent_failures(self, limit: int = 10) -> list[sqlite3.Row]:
-        cursor = self._execute(
+        return self._query(
             "SELECT * FROM failures ORDER BY timestamp DESC LIMIT ?",
             [limit],
         )
-        return list(cursor.fetchall())
 
     def get_recent_health_checks(self, limit: int = 200) -> list[sqlite3.Row]:
-        cursor = self._execute(
+        return self._query(
             "SELECT * FROM health_checks ORDER BY timestamp DESC LIMIT ?",
             [limit],
         )
-        return list(cursor.fetchall())
+
+    def get_recent_health_check_summaries(self, limit: int = 200) -> list[sqlite3.Row]:
+        """Like ``get_recent_health_checks`` but only the columns reports read."""
+        return self._query(
+            """
+            SELECT internet_reachable, dns_working, netbird_running, services_status
+            FROM health_checks ORDER BY timestamp DESC LIMIT ?
+            """,
+            [limit],
+        )
 
     def clear_all(self) -> None:
         self._execute("DELETE FROM health_checks")
@@ -68,6 +68,17 @@ CREATE TABLE IF NOT EXISTS meta_logs (
 );
 """
 
+# Recent-row queries order by timestamp; these keep them to an index range scan.
+TIMESTAMP_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_health_checks_ts ON health_checks(timestamp DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_failures_ts ON failures(timestamp DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_windows_events_ts ON windows_events(captured_timestamp DESC);",
+    "CREATE INDEX IF NOT EXISTS idx_meta_logs_ts ON meta_logs(timestamp DESC);",
+]
+
+# Supports filtering failures by type (e.g. only auto_detected) newest first.
+FAILURE_TYPE_INDEX = "CREATE INDEX IF NOT EXISTS idx_failures_type_ts ON failures(failure_type, timestamp DESC);"
+
 
 def schema_statements() -> list[str]:
     return [
@@ -75,4 +86,6 @@ def schema_statements() -> list[str]:
         FAILURES_TABLE,
         WINDOWS_EVENTS_TABLE,
         META_LOGS_TABLE,
+        *TIMESTAMP_INDEXES,
+        FAILURE_TYPE_INDEX,
     ]